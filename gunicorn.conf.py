@@ -0,0 +1,37 @@
+"""
+gunicorn.conf.py
+Production server profile (Linux/macOS). Picked up automatically when
+gunicorn is started from the project root:
+
+    gunicorn run:app
+
+The app is imported once in the master (preload), which also creates the
+SQLite schema, then forked into one worker per core. Workers open their
+own database connections per request.
+
+Env overrides:
+    BIND          – address to listen on (default: 0.0.0.0:8000)
+    WEB_WORKERS   – worker processes (default: CPU count)
+    WEB_THREADS   – threads per worker (default: 2)
+"""
+
+import multiprocessing
+import os
+
+# per-worker token buckets alone would multiply limits by the worker count
+os.environ.setdefault("RATELIMIT_SHARED", "1")
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.environ.get("WEB_THREADS", 2))
+preload_app = True
+timeout = 30
+# SMTP sends run inside the request; give workers time to finish them
+graceful_timeout = 30
+accesslog = "-"
+
+
+def post_fork(server, worker):
+    from rxlabel.extensions import db
+
+    db.reset_after_fork()
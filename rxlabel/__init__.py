@@ -1,6 +1,9 @@
 import os
 from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
 from .extensions import db
+from .compression import compress
+from .ratelimit import limiter
 from .blueprints.main import main_bp
 from .blueprints.license import license_bp
 from .blueprints.admin import admin_bp
@@ -32,11 +35,20 @@ def create_app():
             "MAIL_PASSWORD", "nprp xtnj escl livg"
         ),  # set in env
         MAIL_FROM_NAME=os.environ.get("MAIL_FROM_NAME", "RxLabel"),
+        # ── Rate limiting (see ratelimit.py) ──────────────
+        RATELIMIT_SHARED=os.environ.get("RATELIMIT_SHARED", "") == "1",
+        # number of trusted proxies setting X-Forwarded-For (0 = direct clients)
+        PROXY_FIX_X_FOR=int(os.environ.get("PROXY_FIX_X_FOR", 0)),
     )
 
+    if app.config["PROXY_FIX_X_FOR"]:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["PROXY_FIX_X_FOR"])
+
     os.makedirs(os.path.join(root, "instance"), exist_ok=True)
 
     db.init_app(app)
+    compress.init_app(app)
+    limiter.init_app(app)
 
     app.register_blueprint(main_bp)
     app.register_blueprint(license_bp)
@@ -1,3 +1,4 @@
+import hashlib
 from functools import wraps
 from flask import (
     Blueprint, render_template, request,
@@ -8,6 +9,14 @@ from ..email_service import send_invoice
 
 admin_bp = Blueprint('admin', __name__)
 
+STATUSES = ('pending', 'approved', 'rejected')
+
+# columns the JSON API may project (order = default output order)
+REQUEST_FIELDS = (
+    'id', 'facility_name', 'facility_contact', 'facility_address',
+    'facility_email', 'license_type', 'status', 'submitted_at',
+)
+
 
 # ── AUTH ──────────────────────────────────────────────────
 def login_required(f):
@@ -19,6 +28,16 @@ def login_required(f):
     return decorated
 
 
+def api_login_required(f):
+    """Like login_required, but answers fetch() callers with a JSON 401."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if not session.get('admin_logged_in'):
+            return jsonify({'success': False, 'message': 'Login required.'}), 401
+        return f(*args, **kwargs)
+    return decorated
+
+
 @admin_bp.route('/login', methods=['GET', 'POST'])
 def login():
     if session.get('admin_logged_in'):
@@ -46,6 +65,12 @@ def logout():
 @admin_bp.route('/dashboard')
 @login_required
 def dashboard():
+    stats = db.cached('license_requests', 'admin.dashboard', _dashboard_stats)
+    mail_configured = bool(current_app.config.get('MAIL_USERNAME'))
+    return render_template('admin/dashboard.html', **stats, mail_configured=mail_configured)
+
+
+def _dashboard_stats():
     total    = db.execute('SELECT COUNT(*) FROM license_requests').fetchone()[0]
     pending  = db.execute("SELECT COUNT(*) FROM license_requests WHERE status='pending'").fetchone()[0]
     approved = db.execute("SELECT COUNT(*) FROM license_requests WHERE status='approved'").fetchone()[0]
@@ -54,24 +79,62 @@ def dashboard():
     by_type  = db.execute(
         'SELECT license_type, COUNT(*) as cnt FROM license_requests GROUP BY license_type ORDER BY cnt DESC'
     ).fetchall()
-    mail_configured = bool(current_app.config.get('MAIL_USERNAME'))
-    return render_template('admin/dashboard.html',
-                           total=total, pending=pending, approved=approved, rejected=rejected,
-                           recent=recent, by_type=by_type, mail_configured=mail_configured)
+    return dict(total=total, pending=pending, approved=approved, rejected=rejected,
+                recent=recent, by_type=by_type)
 
 
 # ── REQUESTS LIST ─────────────────────────────────────────
 @admin_bp.route('/requests')
 @login_required
 def requests_list():
+    # rows are fetched client-side from requests_api
     sf = request.args.get('status', '')
-    if sf in ('pending', 'approved', 'rejected'):
-        rows = db.execute(
-            'SELECT * FROM license_requests WHERE status=? ORDER BY submitted_at DESC', (sf,)
-        ).fetchall()
-    else:
-        rows = db.execute('SELECT * FROM license_requests ORDER BY submitted_at DESC').fetchall()
-    return render_template('admin/requests.html', requests=rows, status_filter=sf)
+    if sf not in STATUSES:
+        sf = ''
+    return render_template('admin/requests.html', status_filter=sf)
+
+
+# ── REQUESTS API ──────────────────────────────────────────
+@admin_bp.route('/api/requests')
+@api_login_required
+def requests_api():
+    sf  = request.args.get('status', '')
+    raw = request.args.get('fields', '')
+    # dedupe while keeping the caller's order
+    fields = list(dict.fromkeys(f.strip() for f in raw.split(',') if f.strip()))
+    fields = fields or list(REQUEST_FIELDS)
+    unknown = [f for f in fields if f not in REQUEST_FIELDS]
+    if unknown:
+        return jsonify({'success': False,
+                        'message': f'Unknown field(s): {", ".join(unknown)}.'}), 400
+    if sf and sf not in STATUSES:
+        return jsonify({'success': False, 'message': 'Invalid status.'}), 400
+
+    # validator covers table state plus the query shape, so it is checked
+    # before any rows are read
+    key  = f'{db.revision("license_requests")}:{sf}:{",".join(fields)}'
+    etag = hashlib.sha1(key.encode()).hexdigest()[:16]
+    if request.if_none_match.contains_weak(etag):
+        resp = current_app.response_class(status=304)
+        resp.set_etag(etag, weak=True)
+        # a 304 must carry the Vary/Cache-Control the 200 would have had
+        resp.vary.add('Accept-Encoding')
+        resp.headers['Cache-Control'] = 'private, no-cache'
+        return resp
+
+    # column names are whitelisted above, safe to interpolate
+    sql = f'SELECT {", ".join(fields)} FROM license_requests'
+    params = ()
+    if sf:
+        sql += ' WHERE status=?'
+        params = (sf,)
+    rows = db.execute(sql + ' ORDER BY submitted_at DESC', params).fetchall()
+
+    # columnar payload: field names once, then one array per row
+    resp = jsonify({'fields': fields, 'rows': [list(r) for r in rows]})
+    resp.set_etag(etag, weak=True)
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    return resp
 
 
 # ── UPDATE STATUS ─────────────────────────────────────────
@@ -80,7 +143,7 @@ def requests_list():
 def update_status(req_id):
     data   = request.get_json(silent=True)
     status = data.get('status') if data else None
-    if status not in ('pending', 'approved', 'rejected'):
+    if status not in STATUSES:
         return jsonify({'success': False, 'message': 'Invalid status.'}), 400
     db.execute('UPDATE license_requests SET status=? WHERE id=?', (status, req_id))
     db.commit()
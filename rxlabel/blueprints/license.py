@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from datetime import datetime
 from ..extensions import db
+from ..ratelimit import limiter
 from ..email_service import send_license_request_notification, send_request_confirmation
 
 license_bp = Blueprint("license", __name__)
@@ -22,6 +23,11 @@ VALID_LICENSE_TYPES = {
 
 @license_bp.route("/request-license", methods=["POST"])
 def request_license():
+    # throttle before any parsing, database or mail work
+    retry_after = limiter.hit("ip", request.remote_addr)
+    if retry_after:
+        return limiter.too_many(retry_after)
+
     data = request.get_json(silent=True)
     if not data:
         return jsonify({"success": False, "message": "Invalid request."}), 400
@@ -43,6 +49,10 @@ def request_license():
 
     req = {k: data[k].strip() for k in REQUIRED_FIELDS}
 
+    retry_after = limiter.hit("email", req["facility_email"].lower())
+    if retry_after:
+        return limiter.too_many(retry_after)
+
     db.execute(
         """INSERT INTO license_requests
                (facility_name, facility_contact, facility_address,
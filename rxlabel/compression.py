@@ -0,0 +1,86 @@
+"""
+compression.py
+Response compression for dynamic (non-static) responses.
+
+gzip comes from the stdlib; brotli is used when the optional `brotli`
+package is installed and the client advertises it.
+
+Config keys read from app.config:
+    COMPRESS_MIN_SIZE  – smallest body (bytes) worth compressing (default: 500)
+    COMPRESS_LEVEL     – gzip level 1-9 (default: 6)
+"""
+
+import gzip
+from flask import request, current_app
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    "text/html",
+    "text/plain",
+    "text/css",
+    "application/json",
+    "application/javascript",
+}
+
+
+class _Compress:
+    """after_request hook that gzip/brotli-encodes eligible responses."""
+
+    def init_app(self, app):
+        app.config.setdefault("COMPRESS_MIN_SIZE", 500)
+        app.config.setdefault("COMPRESS_LEVEL", 6)
+        app.after_request(self._compress)
+
+    # ── negotiation ─────────────────────────────────────────
+    @staticmethod
+    def _choose_encoding():
+        accepted = request.accept_encodings
+        if brotli is not None and accepted["br"]:
+            return "br"
+        if accepted["gzip"]:
+            return "gzip"
+        return None
+
+    def _eligible(self, response, app):
+        if request.endpoint == "static":
+            return False
+        if response.direct_passthrough or response.is_streamed:
+            return False
+        if not 200 <= response.status_code < 300 or response.status_code == 204:
+            return False
+        if "Content-Encoding" in response.headers:
+            return False
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return False
+        length = response.content_length
+        return length is not None and length >= app.config["COMPRESS_MIN_SIZE"]
+
+    # ── hook ────────────────────────────────────────────────
+    def _compress(self, response):
+        if not self._eligible(response, current_app):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = self._choose_encoding()
+        if encoding is None:
+            return response
+
+        body = response.get_data()
+        if encoding == "br":
+            body = brotli.compress(body)
+        else:
+            body = gzip.compress(body, compresslevel=current_app.config["COMPRESS_LEVEL"])
+
+        response.set_data(body)
+        response.headers["Content-Encoding"] = encoding
+        # a strong validator must differ per representation
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+
+compress = _Compress()
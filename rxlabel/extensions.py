@@ -3,7 +3,16 @@ from flask import g, current_app
 
 
 class _DB:
-    """Thin wrapper that gives us a per-request SQLite connection."""
+    """Thin wrapper that gives us a per-request SQLite connection.
+
+    Connections are only ever opened inside a request (or a short-lived
+    schema init), so nothing is inherited across a pre-fork server's
+    workers. Process-local caches are keyed on `table_revisions`, which
+    every worker sees, so a write in one worker invalidates all of them.
+    """
+
+    def __init__(self):
+        self._cache = {}  # key -> (revision, value)
 
     def init_app(self, app):
         app.teardown_appcontext(self._close)
@@ -27,6 +36,8 @@ class _DB:
     def _init_schema(self, app):
         with app.app_context():
             conn = sqlite3.connect(app.config['DATABASE'])
+            # WAL lets workers read while another one writes
+            conn.execute('PRAGMA journal_mode=WAL')
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS license_requests (
                     id               INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -39,9 +50,53 @@ class _DB:
                     submitted_at     TEXT    NOT NULL
                 )
             ''')
+            # Monotonic per-table revision, bumped by triggers on every write.
+            # Lets readers (ETags, caches) detect changes without scanning rows.
+            # `token` is random per database file, so a recreated database
+            # never reuses an earlier (token, revision) pair.
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS table_revisions (
+                    name     TEXT    PRIMARY KEY,
+                    token    TEXT    NOT NULL,
+                    revision INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            self._track_revisions(conn, 'license_requests')
+            # Fixed-window counters shared by all workers (see ratelimit.py).
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS rate_limits (
+                    key          TEXT    NOT NULL,
+                    window_start REAL    NOT NULL,
+                    hits         INTEGER NOT NULL,
+                    expires_at   REAL    NOT NULL,
+                    PRIMARY KEY (key, window_start)
+                )
+            ''')
+            # expired windows are pruned on every shared hit
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS rate_limits_expires_at
+                ON rate_limits (expires_at)
+            ''')
             conn.commit()
             conn.close()
 
+    @staticmethod
+    def _track_revisions(conn, table):
+        """Register `table` in table_revisions and bump it on every write."""
+        conn.execute('''
+            INSERT OR IGNORE INTO table_revisions (name, token)
+            VALUES (?, lower(hex(randomblob(8))))
+        ''', (table,))
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_rev_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE table_revisions SET revision = revision + 1
+                    WHERE name = '{table}';
+                END
+            ''')
+
     # ── convenience ──────────────────────────────────────────
     def execute(self, sql, params=()):
         return self.get().execute(sql, params)
@@ -49,5 +104,36 @@ class _DB:
     def commit(self):
         self.get().commit()
 
+    def revision(self, table):
+        """
+        Opaque tag that changes on every write to `table`. Raises LookupError
+        if the table was not registered with _track_revisions(), since a
+        constant tag would make callers treat stale data as current.
+        """
+        row = self.execute(
+            'SELECT token, revision FROM table_revisions WHERE name=?', (table,)
+        ).fetchone()
+        if row is None:
+            raise LookupError(f'{table!r} has no revision tracking')
+        return f'{row[0]}.{row[1]}'
+
+    # ── cross-worker cache ───────────────────────────────────
+    def cached(self, table, key, compute):
+        """
+        Return `compute()`, memoised per process until `table` is written
+        to by any worker. `table` must be registered with _track_revisions().
+        """
+        rev = self.revision(table)
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == rev:
+            return hit[1]
+        value = compute()
+        self._cache[key] = (rev, value)
+        return value
+
+    def reset_after_fork(self):
+        """Drop state copied from the parent process (see gunicorn.conf.py)."""
+        self._cache.clear()
+
 
 db = _DB()
@@ -0,0 +1,127 @@
+"""
+ratelimit.py
+Submission throttling for public POST endpoints.
+
+Each worker keeps an in-memory token bucket per scope (e.g. client IP,
+facility email). When RATELIMIT_SHARED is on, requests that pass the local
+bucket are also counted in a SQLite fixed-window table so the limit holds
+across worker processes.
+
+Config keys read from app.config:
+    RATELIMIT_ENABLED    – master switch (default: True)
+    RATELIMIT_SHARED     – also count in the rate_limits table (default: False)
+    RATELIMIT_PER_IP     – (requests, seconds) per client IP (default: 10 / hour)
+    RATELIMIT_PER_EMAIL  – (requests, seconds) per facility email (default: 3 / hour)
+
+The per-scope limits are read once, in init_app(); later config changes
+do not affect a running app.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app, jsonify
+from .extensions import db
+
+SCOPES = {
+    "ip": "RATELIMIT_PER_IP",
+    "email": "RATELIMIT_PER_EMAIL",
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token buckets keyed by string, refilled continuously.
+
+    At most MAX_KEYS buckets are kept; the least recently used one is
+    evicted first, so memory and per-call cost stay bounded however many
+    distinct keys clients send.
+    """
+
+    MAX_KEYS = 10_000
+
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period  # tokens per second
+        self._state = OrderedDict()  # key -> (tokens, last_refill), LRU first
+        self._lock = threading.Lock()
+
+    def take(self, key, now=None):
+        """
+        Consume one token for `key`. Returns 0 when allowed, otherwise the
+        number of seconds until a token becomes available.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, last = self._state.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last) * self.rate)
+            allowed = tokens >= 1
+            self._state[key] = (tokens - 1 if allowed else tokens, now)
+            self._state.move_to_end(key)
+            while len(self._state) > self.MAX_KEYS:
+                self._state.popitem(last=False)
+            return 0 if allowed else (1 - tokens) / self.rate
+
+
+class _RateLimiter:
+    """Per-app registry of buckets plus the optional shared SQLite counter."""
+
+    def init_app(self, app):
+        app.config.setdefault("RATELIMIT_ENABLED", True)
+        app.config.setdefault("RATELIMIT_SHARED", False)
+        app.config.setdefault("RATELIMIT_PER_IP", (10, 3600))
+        app.config.setdefault("RATELIMIT_PER_EMAIL", (3, 3600))
+        app.extensions["ratelimit"] = {
+            scope: TokenBucket(*app.config[cfg_key]) for scope, cfg_key in SCOPES.items()
+        }
+
+    # ── checks ──────────────────────────────────────────────
+    def hit(self, scope, key):
+        """
+        Count one request for `key` in `scope`. Returns 0 when allowed,
+        otherwise the seconds the client should wait before retrying.
+        """
+        cfg = current_app.config
+        if not cfg["RATELIMIT_ENABLED"] or not key:
+            return 0
+        # the bucket holds the limits both layers enforce
+        bucket = current_app.extensions["ratelimit"][scope]
+        wait = bucket.take(key)
+        if wait:
+            return wait
+        if cfg["RATELIMIT_SHARED"]:
+            return self._shared_hit(f"{scope}:{key}", bucket.capacity, bucket.period)
+        return 0
+
+    def _shared_hit(self, key, capacity, period):
+        now = time.time()
+        window_start = now - now % period
+        expires_at = window_start + period
+        hits = db.execute(
+            """INSERT INTO rate_limits (key, window_start, hits, expires_at)
+               VALUES (?, ?, 1, ?)
+               ON CONFLICT (key, window_start) DO UPDATE SET hits = hits + 1
+               RETURNING hits""",
+            (key, window_start, expires_at),
+        ).fetchone()[0]
+        db.execute("DELETE FROM rate_limits WHERE expires_at < ?", (now,))
+        db.commit()
+        return expires_at - now if hits > capacity else 0
+
+    # ── response ────────────────────────────────────────────
+    @staticmethod
+    def too_many(retry_after):
+        resp = jsonify(
+            {
+                "success": False,
+                "message": "Too many requests. Please try again later.",
+            }
+        )
+        resp.status_code = 429
+        resp.headers["Retry-After"] = str(math.ceil(retry_after))
+        return resp
+
+
+limiter = _RateLimiter()
@@ -38,4 +38,85 @@
   document.querySelectorAll('.action-select').forEach((el) => {
     el.dataset.prev = el.value;
   });
+
+  /* ── REQUESTS TABLE (rendered from /admin/api/requests) ── */
+  const rowsEl = document.getElementById('reqRows');
+  if (!rowsEl) return;
+
+  const FIELDS = ['id', 'facility_name', 'facility_address', 'facility_contact',
+                  'facility_email', 'license_type', 'submitted_at', 'status'];
+  const STATUSES = [['pending', 'Pending'], ['approved', 'Approved'], ['rejected', 'Rejected']];
+
+  function el(tag, props = {}, children = []) {
+    const node = Object.assign(document.createElement(tag), props);
+    children.forEach((c) => node.append(c));
+    return node;
+  }
+
+  function renderRow(r) {
+    const status = el('select', { className: 'action-select' },
+      STATUSES.map(([v, label]) => el('option', { value: v, textContent: label, selected: v === r.status })));
+    status.dataset.prev = r.status;
+    status.dataset.id = r.id;
+
+    const invoice = el('button', { className: 'btn-invoice', innerHTML: '&#128176; Invoice' });
+    invoice.dataset.id = r.id;
+
+    return el('tr', {}, [
+      el('td', { className: 'mono', textContent: '#' + r.id }),
+      el('td', {}, [
+        el('div', { className: 'req-name', textContent: r.facility_name }),
+        el('div', { className: 'req-address', textContent: r.facility_address }),
+      ]),
+      el('td', { className: 'nowrap', textContent: r.facility_contact }),
+      el('td', {}, [
+        el('a', { className: 'req-email', href: 'mailto:' + r.facility_email, textContent: r.facility_email }),
+      ]),
+      el('td', {}, [el('span', { className: 'license-chip', textContent: r.license_type })]),
+      el('td', { className: 'mono nowrap', textContent: r.submitted_at.slice(0, 16) }),
+      el('td', {}, [status]),
+      el('td', {}, [el('div', { className: 'action-btns' }, [invoice])]),
+    ]);
+  }
+
+  const byId = new Map();
+
+  async function loadRequests() {
+    const url = new URL(rowsEl.dataset.src, location.origin);
+    url.searchParams.set('fields', FIELDS.join(','));
+    try {
+      const res  = await fetch(url);
+      if (res.status === 401) { location.href = '/admin/login'; return; }
+      if (!res.ok) throw new Error(res.statusText);
+      const data = await res.json();
+      const rows = data.rows.map((values) =>
+        Object.fromEntries(data.fields.map((f, i) => [f, values[i]])));
+
+      byId.clear();
+      rows.forEach((r) => byId.set(String(r.id), r));
+      rowsEl.replaceChildren(...rows.map(renderRow));
+
+      document.getElementById('reqCount').textContent =
+        rows.length + ' record' + (rows.length !== 1 ? 's' : '');
+      document.getElementById('reqTable').hidden = rows.length === 0;
+      document.getElementById('reqEmpty').hidden = rows.length !== 0;
+    } catch (err) {
+      document.getElementById('reqCount').textContent = '';
+      window.showAdminToast('Could not load requests.', true);
+    }
+  }
+
+  /* delegated handlers – no per-row inline JS */
+  rowsEl.addEventListener('change', (e) => {
+    const sel = e.target.closest('.action-select');
+    if (sel) window.updateStatus(sel.dataset.id, sel.value, sel);
+  });
+  rowsEl.addEventListener('click', (e) => {
+    const btn = e.target.closest('.btn-invoice');
+    if (!btn) return;
+    const r = byId.get(btn.dataset.id);
+    window.openInvoiceModal(r.id, r.facility_name, r.facility_email, r.license_type);
+  });
+
+  loadRequests();
 })();